@@ -2,11 +2,15 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
+from .const import CONF_CFG, CONF_IP, CONF_MAC, CONF_TYPE, COORDINATED_DEVICE, DOMAIN
+from .coordinator import SihasCoordinator
+from .sender import close
+from .sihas_base import SihasBase
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,12 +26,31 @@ PLATFORMS: list[str] = [
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     # NOTE: how about checking supported type at here?
-    _LOGGER.info(f"entry setuped: {entry.data}")
+    _LOGGER.info("entry setuped: %s", entry.data)
+
+    # entry.data may hold updated IP by discovery when unloaded, close IP of this setup
+    entry.async_on_unload(partial(close, entry.data[CONF_IP]))
+
+    if entry.data[CONF_TYPE] in COORDINATED_DEVICE:
+        coordinator = SihasCoordinator(
+            hass,
+            SihasBase(
+                entry.data[CONF_IP],
+                entry.data[CONF_MAC],
+                entry.data[CONF_TYPE],
+                entry.data[CONF_CFG],
+            ),
+        )
+        await coordinator.async_config_entry_first_refresh()
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
-    _LOGGER.info(f"entry unloadded: {entry.data}")
+    _LOGGER.info("entry unloadded: %s", entry.data)
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
     return unload_ok
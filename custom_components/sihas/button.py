@@ -13,20 +13,19 @@ from typing_extensions import Final
 
 from .climate import Acm300
 from .const import (
-    CONF_CFG,
-    CONF_IP,
-    CONF_MAC,
-    CONF_NAME,
     CONF_TYPE,
     DEFAULT_PARALLEL_UPDATES,
+    DOMAIN,
     ICON_BUTTON,
     SIHAS_PLATFORM_SCHEMA,
 )
-from .packet_builder import packet_builder as pb
-from .sender import send
+from .coordinator import SihasCoordinator, SihasCoordinatorEntity
+from .util import register_put_u32
 
 SCAN_INTERVAL: Final = timedelta(seconds=5)
 
+ACM_MAX_UCR: Final = 20
+
 _LOGGER = logging.getLogger(__name__)
 
 PARALLEL_UPDATES: Final = DEFAULT_PARALLEL_UPDATES
@@ -37,48 +36,41 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     if entry.data[CONF_TYPE] == "ACM":
-        acm = Acm300(
-            entry.data[CONF_IP],
-            entry.data[CONF_MAC],
-            entry.data[CONF_TYPE],
-            entry.data[CONF_CFG],
-            entry.data[CONF_NAME],
-        )
-
-        async_add_entities(await get_ucr(acm))
+        coordinator: SihasCoordinator = hass.data[DOMAIN][entry.entry_id]
+        async_add_entities(get_ucr(coordinator))
     return
 
 
-async def get_ucr(acm) -> List[AcmUCR]:
-
+def get_ucr(coordinator: SihasCoordinator) -> List[AcmUCR]:
+    """Generate buttons for UCR registered on ACM, from registers polled by coordinator"""
     try:
-        req = pb.poll()
-        resp = send(
-            data=req,
-            ip=acm.ip,
-            retry=3,
-        )
+        registers = coordinator.data
+        ucr_reg = register_put_u32(registers[Acm300.REG_LIST_UCR1], registers[Acm300.REG_LIST_UCR2])
+        ucr_reg &= (1 << ACM_MAX_UCR) - 1
 
-        acm.registers = pb.extract_registers(resp)
-        ucr_reg = acm.registers[Acm300.REG_LIST_UCR1] + (acm.registers[Acm300.REG_LIST_UCR2] << 16)
+        # walk set bits only, from lowest one
         urcs = []
-        for i in range(0, 20):
-            if ucr_reg & (1 << i) != 0:
-                urcs.append(AcmUCR(acm, i))
+        while ucr_reg:
+            i = (ucr_reg & -ucr_reg).bit_length() - 1
+            urcs.append(AcmUCR(coordinator, i))
+            ucr_reg &= ucr_reg - 1
         return urcs
     except Exception as e:
-        _LOGGER.error(f"failed to get UCR: {str(e)}")
+        _LOGGER.error("failed to get UCR: %s", e)
         return []
 
 
-class AcmUCR(ButtonEntity):
+class AcmUCR(SihasCoordinatorEntity, ButtonEntity):
     _attr_icon = ICON_BUTTON
 
-    def __init__(self, acm: Acm300, number_of_button: int):
-        self.acm = acm
+    def __init__(self, coordinator: SihasCoordinator, number_of_button: int):
+        device = coordinator.device
+        super().__init__(
+            coordinator,
+            uid=f"{device.device_type}-{device.mac}-{number_of_button}",
+            name=f"리모컨 #{number_of_button + 1}",
+        )
         self.number_of_button = number_of_button
-        self._attr_name = f"리모컨 #{number_of_button + 1}"
-        self._attr_unique_id = f"{acm.device_type}-{acm.mac}-{number_of_button}"
 
-    def press(self) -> None:
-        self.acm.command(Acm300.REG_EXEC_UCR, self.number_of_button)
+    async def async_press(self) -> None:
+        await self.coordinator.async_command(Acm300.REG_EXEC_UCR, self.number_of_button)
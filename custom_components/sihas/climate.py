@@ -2,13 +2,10 @@
 from __future__ import annotations
 
 import logging
-import math
-from abc import abstractmethod
 from dataclasses import dataclass
-from datetime import timedelta
 from enum import Enum, IntEnum
-import time
-from typing import Dict, List, Optional, cast
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, cast
 
 from homeassistant.components.climate import ClimateEntity
 from homeassistant.components.climate.const import (
@@ -24,34 +21,27 @@ from homeassistant.components.climate.const import (
     SWING_OFF,
     SWING_VERTICAL,
 )
-from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_TEMPERATURE,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from typing_extensions import Final
 
 from .const import (
-    CONF_CFG,
-    CONF_IP,
-    CONF_MAC,
     CONF_NAME,
     CONF_TYPE,
     DEFAULT_PARALLEL_UPDATES,
+    DOMAIN,
     ICON_COOLER,
     ICON_HEATER,
     SIHAS_PLATFORM_SCHEMA,
 )
-from .errors import ModbusNotEnabledError, PacketSizeError
-from .packet_builder import packet_builder as pb
-from .sender import send
-from .sihas_base import SihasEntity, SihasProxy, SihasSubEntity
-
-SCAN_INTERVAL: Final = timedelta(seconds=5)
+from .coordinator import SihasCoordinator, SihasCoordinatorEntity
+from .sihas_base import SihasSubEntity
 
 HCM_REG_ONOFF: Final = 0
 HCM_REG_SET_TMP: Final = 1
@@ -78,94 +68,55 @@ PLATFORM_SCHEMA: Final = SIHAS_PLATFORM_SCHEMA
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
-    if entry.data[CONF_TYPE] == "ACM":
-        async_add_entities(
-            [
-                Acm300(
-                    entry.data[CONF_IP],
-                    entry.data[CONF_MAC],
-                    entry.data[CONF_TYPE],
-                    entry.data[CONF_CFG],
-                    entry.data[CONF_NAME],
-                ),
-            ],
-        )
-    elif entry.data[CONF_TYPE] in ["HCM", "HVM"]:
-        try:
-            async_add_entities(
-                HcmHvm300(
-                    entry.data[CONF_IP],
-                    entry.data[CONF_MAC],
-                    entry.data[CONF_TYPE],
-                    entry.data[CONF_CFG],
-                    entry.data[CONF_NAME],
-                ).get_sub_entities()
-            )
+    if (create_entities := _ENTITY_FACTORIES.get(entry.data[CONF_TYPE])) is None:
+        return
 
-        except (ModbusNotEnabledError, PacketSizeError) as e:
-            raise e
-
-        except Exception as e:
-            _LOGGER.error(
-                "failed to add device <%s, %s>, be sure IP is correct and restart HA to load HCM/HVM: %s",
-                entry.data[CONF_TYPE],
-                entry.data[CONF_IP],
-                e,
-            )
-    elif entry.data[CONF_TYPE] == "BCM":
-        async_add_entities(
-            [
-                Bcm300(
-                    entry.data[CONF_IP],
-                    entry.data[CONF_MAC],
-                    entry.data[CONF_TYPE],
-                    entry.data[CONF_CFG],
-                    entry.data[CONF_NAME],
-                ),
-            ],
-        )
-    elif entry.data[CONF_TYPE] == "TCM":
-        async_add_entities(
-            [
-                Tcm300(
-                    entry.data[CONF_IP],
-                    entry.data[CONF_MAC],
-                    entry.data[CONF_TYPE],
-                    entry.data[CONF_CFG],
-                    entry.data[CONF_NAME],
-                ),
-            ],
-        )
+    coordinator: SihasCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(create_entities(coordinator, entry))
     return
 
 
-class HcmHvm300(SihasProxy):
-    def __init__(
-        self,
-        ip: str,
-        mac: str,
-        device_type: str,
-        config: int,
-        name: Optional[str] = None,
-    ) -> None:
-        super().__init__(
-            ip,
-            mac,
-            device_type,
-            config,
-        )
-        self.name = name
+def _create_acm(coordinator: SihasCoordinator, entry: ConfigEntry) -> List[Entity]:
+    return [Acm300(coordinator, entry.data[CONF_NAME])]
+
+
+def _create_hcm_hvm(coordinator: SihasCoordinator, entry: ConfigEntry) -> List[Entity]:
+    """Generate rooms, from registers polled by first refresh of coordinator"""
+    reg_num_rooms: Final[int] = (
+        HCM_REG_NUMBER_OF_ROOMS if entry.data[CONF_TYPE] == "HCM" else HVM_REG_NUMBER_OF_ROOMS
+    )
+    return [
+        HcmHvmVirtualThermostat(coordinator, i, entry.data[CONF_NAME])
+        for i in range(0, coordinator.data[reg_num_rooms])
+    ]
+
+
+def _create_bcm(coordinator: SihasCoordinator, entry: ConfigEntry) -> List[Entity]:
+    return [Bcm300(coordinator, entry.data[CONF_NAME])]
+
+
+def _create_tcm(coordinator: SihasCoordinator, entry: ConfigEntry) -> List[Entity]:
+    return [Tcm300(coordinator, entry.data[CONF_NAME])]
+
 
-    def get_sub_entities(self) -> List[Entity]:
-        req = pb.poll()
-        resp = send(req, self.ip)
-        self.registers = pb.extract_registers(resp)
-        reg_num_rooms: Final[int] = HCM_REG_NUMBER_OF_ROOMS if self.device_type == "HCM" else HVM_REG_NUMBER_OF_ROOMS
-        number_of_room = self.registers[reg_num_rooms]
-        return [HcmHvmVirtualThermostat(self, i, self.name) for i in range(0, number_of_room)]
+# device type -> function, which create climate entities of config entry
+_ENTITY_FACTORIES: Final[Dict[str, Callable[[SihasCoordinator, ConfigEntry], List[Entity]]]] = {
+    "ACM": _create_acm,
+    "HCM": _create_hcm_hvm,
+    "HVM": _create_hcm_hvm,
+    "BCM": _create_bcm,
+    "TCM": _create_tcm,
+}
 
 
-class HcmHvmVirtualThermostat(SihasSubEntity, ClimateEntity):
+# hvac mode -> on/off bit of room register
+_HCM_ONOFF_BY_HVAC_MODE: Final = {
+    HVACMode.HEAT: 1,
+    HVACMode.OFF: 0,
+}
+
+
+class HcmHvmVirtualThermostat(SihasSubEntity, SihasCoordinatorEntity, ClimateEntity):
     _attr_icon = ICON_HEATER
 
     _attr_hvac_modes: Final = [HVACMode.OFF, HVACMode.HEAT]
@@ -175,69 +126,72 @@ class HcmHvmVirtualThermostat(SihasSubEntity, ClimateEntity):
     _attr_target_temperature_step = 0.5
     _attr_temperature_unit: Final = UnitOfTemperature.CELSIUS
 
-    def __init__(self, proxy: HcmHvm300, number_of_room: int, name: Optional[str] = None) -> None:
-        super().__init__(proxy)
-        uid = f"{proxy.device_type}-{proxy.mac}-{number_of_room}"
+    def __init__(
+        self,
+        coordinator: SihasCoordinator,
+        number_of_room: int,
+        name: Optional[str] = None,
+    ) -> None:
+        device = coordinator.device
+        SihasSubEntity.__init__(self, device)
+        SihasCoordinatorEntity.__init__(
+            self,
+            coordinator,
+            uid=f"{device.device_type}-{device.mac}-{number_of_room}",
+            name=f"{name} #{number_of_room + 1}" if name else None,
+        )
 
-        # proxy attr
-        self._proxy = proxy
-        self._attr_available = self._proxy._attr_available
         self._room_register_index = HCM_REG_STATE_START + number_of_room
-        self._attr_unique_id = uid
-        self._attr_name = f"{name} #{number_of_room + 1}" if name else self._attr_unique_id
+        self._register_cache: Optional[int] = None
+        self._temperature_magnification: float = 1
 
-    def set_hvac_mode(self, hvac_mode: str):
-        self._proxy.command(
+    async def async_set_hvac_mode(self, hvac_mode: str):
+        await self.coordinator.async_command(
             self._room_register_index,
             self._apply_hvac_mode_on_cache(hvac_mode),
         )
 
-    def set_temperature(self, **kwargs):
+    async def async_set_temperature(self, **kwargs):
         tmp = cast(float, kwargs.get(ATTR_TEMPERATURE))
-        self._proxy.command(
+        await self.coordinator.async_command(
             self._room_register_index,
             self._apply_target_temperature_on_cache(tmp),
         )
 
-    def update(self):
-        self._proxy.update()
-        self._attr_available = self._proxy._attr_available
-        self._register_cache = self._proxy.registers[self._room_register_index]
-
-        # 최대 온도/온도 단위 가변 설정
-        self._attr_max_temp = 65 if self.temperature_magnification == 0 else (65 / 2)
-        self._attr_target_temperature_step = self.temperature_magnification
-
-        summary = self.parse_room_summary(self._register_cache)
-        self._attr_hvac_mode = summary.hvac_mode
-        self._attr_current_temperature = summary.current_temperature
-        self._attr_target_temperature = summary.target_temperature
-        self._attr_hvac_action = summary.hvac_action
-
-    @property
-    def temperature_magnification(self) -> float:
-        """room summary의 온도 배율을 반환"""
-        return 0.5 if self._proxy.registers[HCM_REG_ROOM_TEMP_UNIT] != 0 else 1
-
-    def parse_room_summary(self, reg: int) -> RoomSummaryData:
-        return RoomSummaryData(
-            ((reg & HCM_MASK_CURTMP) >> 4) * self.temperature_magnification,
-            HVACAction.IDLE if (((reg & HCM_MASK_VALVE) >> 3) == 0) else HVACAction.HEATING,
-            HVACMode.HEAT if ((reg & HCM_MASK_ONOFF) == 1) else HVACMode.OFF,
-            ((reg & HCM_MASK_SETTMP) >> 10) * self.temperature_magnification,
-        )
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        registers = self.coordinator.data
+        reg = registers[self._room_register_index]
+        mag = 0.5 if registers[HCM_REG_ROOM_TEMP_UNIT] != 0 else 1
+
+        # room rarely changes between polls, then attributes are already up to date.
+        # state is written anyway, to reflect availability of coordinator.
+        if reg != self._register_cache or mag != self._temperature_magnification:
+            self._register_cache = reg
+            self._temperature_magnification = mag
+
+            # 최대 온도/온도 단위 가변 설정
+            self._attr_max_temp = 65 if mag == 0 else (65 / 2)
+            self._attr_target_temperature_step = mag
+
+            summary = _parse_room_summary(reg, mag)
+            self._attr_hvac_mode = summary.hvac_mode
+            self._attr_current_temperature = summary.current_temperature
+            self._attr_target_temperature = summary.target_temperature
+            self._attr_hvac_action = summary.hvac_action
+        super()._handle_coordinator_update()
 
     def _apply_hvac_mode_on_cache(self, onoff: str) -> int:
-        mask = 1 if onoff == HVACMode.HEAT else 0
+        mask = _HCM_ONOFF_BY_HVAC_MODE.get(onoff, 0)
         return (self._register_cache & ~HCM_MASK_ONOFF) | mask
 
     def _apply_target_temperature_on_cache(self, t: float) -> int:
-        t = t / self.temperature_magnification
+        t = t / self._temperature_magnification
         mask = int(t)
         return (self._register_cache & ~HCM_MASK_SETTMP) | (mask << 10)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RoomSummaryData:
     current_temperature: float
     hvac_action: str
@@ -245,7 +199,21 @@ class RoomSummaryData:
     target_temperature: float
 
 
-class Acm300(SihasEntity, ClimateEntity):
+@lru_cache(maxsize=4096)
+def _parse_room_summary(reg: int, mag: float) -> RoomSummaryData:
+    """Parse HCM room register
+
+    Room state rarely changes between polls, so result is cached and shared between rooms.
+    """
+    return RoomSummaryData(
+        ((reg & HCM_MASK_CURTMP) >> 4) * mag,
+        HVACAction.HEATING if reg & HCM_MASK_VALVE else HVACAction.IDLE,
+        HVACMode.HEAT if reg & HCM_MASK_ONOFF else HVACMode.OFF,
+        ((reg & HCM_MASK_SETTMP) >> 10) * mag,
+    )
+
+
+class Acm300(SihasCoordinatorEntity, ClimateEntity):
     # base attribute
     _attr_icon = ICON_COOLER
 
@@ -301,24 +269,15 @@ class Acm300(SihasEntity, ClimateEntity):
     ]
     FAN_TABLE: Final = [FAN_LOW, FAN_MEDIUM, FAN_HIGH, FAN_AUTO]
 
-    def __init__(
-        self,
-        ip: str,
-        mac: str,
-        device_type: str,
-        config: int,
-        name: Optional[str] = None,
-    ):
-        super().__init__(
-            ip=ip,
-            mac=mac,
-            device_type=device_type,
-            config=config,
-            name=name,
-        )
+    # reverse lookup of tables above, mode to register value
+    HVAC_MODE_INDEX: Final = {m: i for i, m in enumerate(HVAC_MODE_TABLE)}
+    SWING_MODE_INDEX: Final = {m: i for i, m in enumerate(SWING_MODE_TABLE)}
+    FAN_INDEX: Final = {m: i for i, m in enumerate(FAN_TABLE)}
+
+    def __init__(self, coordinator: SihasCoordinator, name: Optional[str] = None):
+        super().__init__(coordinator, name=name)
 
-    # TODO: async fuction raise excaption. why?
-    def set_hvac_mode(self, hvac_mode: str):
+    async def async_set_hvac_mode(self, hvac_mode: str):
         """
         Set the HVAC mode for the AC unit.
 
@@ -333,65 +292,66 @@ class Acm300(SihasEntity, ClimateEntity):
 
         Behavior:
             - If the command is OFF, the AC unit is turned off.
-            - If the command is not OFF, the mode is changed first, followed by a delay
-              to prevent IR conflict, and then the AC unit is turned on.
+            - If the command is not OFF and the AC unit is off, power, set point and
+              mode are written at once, so the unit turns on in requested mode. Set point
+              is polled right before, so a recent change of it is not reverted.
+            - Otherwise, only the mode is changed.
 
         Note:
-            - A delay of 0.5 seconds is introduced between changing the mode and turning
-              the unit on to prevent IR signal conflicts.
+            - Writing power and mode with single request replaces the previous
+              mode-then-power sequence, which needed a delay of 0.5 seconds between
+              them to prevent IR signal conflicts.
         """
 
         if hvac_mode == HVACMode.OFF:
-            self.command(Acm300.REG_ON_OFF, 0)
+            await self.coordinator.async_command(Acm300.REG_ON_OFF, 0)
             return
 
-        # Change mode first
-        if self.hvac_mode != hvac_mode:
-            self.command(
+        if self.hvac_mode == HVACMode.OFF:
+            # REG_ON_OFF, REG_SET_POINT and REG_MODE are contiguous, set point is kept as polled
+            await self.coordinator.async_refresh()
+            if not self.coordinator.last_update_success:
+                return
+            await self.coordinator.async_command_multiple(
+                Acm300.REG_ON_OFF,
+                [
+                    1,
+                    self.coordinator.data[Acm300.REG_SET_POINT],
+                    self.HVAC_MODE_INDEX[hvac_mode],
+                ],
+            )
+        elif self.hvac_mode != hvac_mode:
+            await self.coordinator.async_command(
                 self.REG_MODE,
-                self.HVAC_MODE_TABLE.index(hvac_mode),
+                self.HVAC_MODE_INDEX[hvac_mode],
             )
-            time.sleep(0.5) # Delay to prevent IR conflict
 
-        if self.hvac_mode == HVACMode.OFF:
-            self.command(Acm300.REG_ON_OFF, 1)
-
-    def set_temperature(self, **kwargs):
+    async def async_set_temperature(self, **kwargs):
         tmp = cast(float, kwargs.get(ATTR_TEMPERATURE))
-        self.command(Acm300.REG_SET_POINT, int(tmp))
-
-    def set_swing_mode(self, swing_mode):
-        self.command(Acm300.REG_SWING, Acm300.SWING_MODE_TABLE.index(swing_mode))
-
-    def set_fan_mode(self, fan_mode):
-        self.command(Acm300.REG_FAN, Acm300.FAN_TABLE.index(fan_mode))
-
-    def update(self):
-        if regs := self.poll():
-            self._attr_hvac_mode = (
-                HVACMode.OFF
-                if regs[Acm300.REG_ON_OFF] == 0
-                else Acm300.HVAC_MODE_TABLE[regs[Acm300.REG_MODE]]
-            )
-            self._attr_swing_mode = Acm300.SWING_MODE_TABLE[regs[Acm300.REG_SWING]]
-            self._attr_fan_mode = Acm300.FAN_TABLE[regs[Acm300.REG_FAN]]
-            if self.config == 1:
-                self._attr_current_temperature = regs[Acm300.REG_AC_TEMP] / 10
-            self._attr_target_temperature = regs[Acm300.REG_SET_POINT]
+        await self.coordinator.async_command(Acm300.REG_SET_POINT, int(tmp))
 
+    async def async_set_swing_mode(self, swing_mode):
+        await self.coordinator.async_command(
+            Acm300.REG_SWING, Acm300.SWING_MODE_INDEX[swing_mode]
+        )
 
-class OutModeEntity(SelectEntity):
-    OUT_MODE: Final[str] = "OUT"  # 외출
-    OCCUPY_MODE: Final[str] = "OCCUPY"  # 재실
+    async def async_set_fan_mode(self, fan_mode):
+        await self.coordinator.async_command(Acm300.REG_FAN, Acm300.FAN_INDEX[fan_mode])
 
-    def __init__(self) -> None:
-        SelectEntity.__init__(self)
-        self._attr_options = [OutModeEntity.OUT_MODE, OutModeEntity.OCCUPY_MODE]
-        self._attr_current_option = None
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # registers from REG_ON_OFF to REG_AC_TEMP are contiguous
+        on_off, set_point, mode, fan, swing, _, ac_temp = self.coordinator.data[
+            Acm300.REG_ON_OFF : Acm300.REG_AC_TEMP + 1
+        ]
 
-    @abstractmethod
-    def select_option(self, option: str) -> None:
-        """Change the selected option."""
+        self._attr_hvac_mode = HVACMode.OFF if on_off == 0 else Acm300.HVAC_MODE_TABLE[mode]
+        self._attr_swing_mode = Acm300.SWING_MODE_TABLE[swing]
+        self._attr_fan_mode = Acm300.FAN_TABLE[fan]
+        if self.coordinator.device.config == 1:
+            self._attr_current_temperature = ac_temp / 10
+        self._attr_target_temperature = set_point
+        super()._handle_coordinator_update()
 
 
 class BcmHeatMode(Enum):
@@ -399,6 +359,10 @@ class BcmHeatMode(Enum):
     Ondol: Final = 1
 
 
+# indexed by heat mode flag of BCM_REG_OPERMODE
+_BCM_HEAT_MODES: Final = (BcmHeatMode.Room, BcmHeatMode.Ondol)
+
+
 @dataclass
 class BcmOpMode:
     isOnsuOn: bool
@@ -424,7 +388,15 @@ BCM_REG_WATERST: Final = 13  # 보일러 물보충상태(0=정상, 1=물보충
 BCM_REG_ONLINEST: Final = 14  # 보일러 통신상태(0=온라인, 1=오프라인)
 
 
-class Bcm300(SihasEntity, ClimateEntity):
+# hvac mode -> (OUTMODE, TIMERMODE), None leaves register unchanged
+_BCM_HVAC_MODE_TO_OUT_TIMER: Final = {
+    HVACMode.FAN_ONLY: (1, None),
+    HVACMode.HEAT: (0, 1),
+    HVACMode.AUTO: (0, 0),
+}
+
+
+class Bcm300(SihasCoordinatorEntity, ClimateEntity):
     _attr_icon = ICON_HEATER
     _attr_hvac_modes: Final = [HVACMode.OFF, HVACMode.HEAT, HVACMode.FAN_ONLY, HVACMode.AUTO]
     _attr_max_temp: Final = 80
@@ -433,87 +405,92 @@ class Bcm300(SihasEntity, ClimateEntity):
     _attr_target_temperature_step: Final = 1
     _attr_temperature_unit: Final = UnitOfTemperature.CELSIUS
 
-    def __init__(
-        self,
-        ip: str,
-        mac: str,
-        device_type: str,
-        config: int,
-        name: str | None = None,
-    ) -> None:
-        super().__init__(
-            ip=ip,
-            mac=mac,
-            device_type=device_type,
-            config=config,
-            name=name,
-        )
+    def __init__(self, coordinator: SihasCoordinator, name: str | None = None) -> None:
+        super().__init__(coordinator, name=name)
 
         self.opmode: Optional[BcmOpMode] = None
 
-    def set_hvac_mode(self, hvac_mode: str):
-        if hvac_mode == HVACMode.FAN_ONLY:
-            self.command(BCM_REG_OUTMODE, 1)
-            self.command(BCM_REG_ONOFF, 1)
-        elif hvac_mode == HVACMode.HEAT:
-            self.command(BCM_REG_OUTMODE, 0)
-            self.command(BCM_REG_ONOFF, 1)
-            self.command(BCM_REG_TIMERMODE, 1)
-        elif hvac_mode == HVACMode.AUTO:
-            self.command(BCM_REG_OUTMODE, 0)
-            self.command(BCM_REG_ONOFF, 1)
-            self.command(BCM_REG_TIMERMODE, 0)
-        elif hvac_mode == HVACMode.OFF:
-            self.command(BCM_REG_ONOFF, 0)
-
-    def set_temperature(self, **kwargs):
+    async def async_set_hvac_mode(self, hvac_mode: str):
+        if hvac_mode == HVACMode.OFF:
+            await self.coordinator.async_command(BCM_REG_ONOFF, 0)
+            return
+
+        if (modes := _BCM_HVAC_MODE_TO_OUT_TIMER.get(hvac_mode)) is None:
+            return
+
+        # write only registers of mode, set points may have changed since last poll
+        outmode, timermode = modes
+        if timermode is None:
+            await self.coordinator.async_command(BCM_REG_OUTMODE, outmode)
+        else:
+            # OUTMODE and TIMERMODE are contiguous
+            await self.coordinator.async_command_multiple(BCM_REG_OUTMODE, [outmode, timermode])
+        await self.coordinator.async_command(BCM_REG_ONOFF, 1)
+
+    async def async_set_temperature(self, **kwargs):
         tmp = cast(float, kwargs.get(ATTR_TEMPERATURE))
 
         assert self.opmode != None
-        self.command(
+        await self.coordinator.async_command(
             BCM_REG_ROOMSETPT if (self.opmode.heatMode == BcmHeatMode.Room) else BCM_REG_ONDOLSETPT,
-            math.floor(tmp),
+            int(tmp),
         )
 
-    def update(self):
-        if regs := self.poll():
-            self.opmode = self._parse_oper_mode(regs)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        regs = self.coordinator.data
+        self.opmode = self._parse_oper_mode(regs)
 
-            self._attr_hvac_mode = self._resolve_hvac_mode(regs)
-            self._attr_hvac_action = self._resolve_hvac_action(regs)
+        self._attr_hvac_mode = self._resolve_hvac_mode(regs)
+        self._attr_hvac_action = self._resolve_hvac_action(regs)
 
-            setpt: Optional[int] = None  # set point
-            curpt: Optional[int] = None  # current point
+        setpt: Optional[int] = None  # set point
+        curpt: Optional[int] = None  # current point
 
-            if self.opmode.heatMode == BcmHeatMode.Room:
-                setpt = regs[BCM_REG_ROOMSETPT]
-                curpt = math.floor(regs[BCM_REG_ROOMTEMP] / 10)
-            else:
-                setpt = regs[BCM_REG_ONDOLSETPT]
-                curpt = regs[BCM_REG_ONDOLTEMP]
+        if self.opmode.heatMode == BcmHeatMode.Room:
+            setpt = regs[BCM_REG_ROOMSETPT]
+            curpt = regs[BCM_REG_ROOMTEMP] // 10
+        else:
+            setpt = regs[BCM_REG_ONDOLSETPT]
+            curpt = regs[BCM_REG_ONDOLTEMP]
+
+        self._attr_current_temperature = curpt
+        self._attr_target_temperature = setpt
+        super()._handle_coordinator_update()
+
+    # indexed by (OUTMODE == 1) << 2 | (TIMERMODE == 1) << 1 | (ONOFF != 0)
+    # off wins over everything, then timer mode wins over out mode
+    _HVAC_MODE_TABLE: Final = (
+        HVACMode.OFF,
+        HVACMode.AUTO,
+        HVACMode.OFF,
+        HVACMode.HEAT,
+        HVACMode.OFF,
+        HVACMode.FAN_ONLY,
+        HVACMode.OFF,
+        HVACMode.HEAT,
+    )
 
-            self._attr_current_temperature = curpt
-            self._attr_target_temperature = setpt
+    # indexed by (FIRE_STATE != 0) << 1 | (ONOFF != 0)
+    _HVAC_ACTION_TABLE: Final = (
+        HVACAction.OFF,
+        HVACAction.IDLE,
+        HVACAction.OFF,
+        HVACAction.HEATING,
+    )
 
     def _resolve_hvac_mode(self, regs):
-        if regs[BCM_REG_ONOFF] == 0:
-            return HVACMode.OFF
-        elif regs[BCM_REG_TIMERMODE] == 1:
-            return HVACMode.HEAT
-        elif regs[BCM_REG_OUTMODE] == 1:
-            return HVACMode.FAN_ONLY
-        else:
-            return HVACMode.AUTO
+        return self._HVAC_MODE_TABLE[
+            ((regs[BCM_REG_OUTMODE] == 1) << 2)
+            | ((regs[BCM_REG_TIMERMODE] == 1) << 1)
+            | (regs[BCM_REG_ONOFF] != 0)
+        ]
 
     def _resolve_hvac_action(self, regs):
-        if regs[BCM_REG_ONOFF] == 0:
-            return HVACAction.OFF
-        # elif regs[BCM_REG_OUTMODE] == 1:
-        #     return HVACAction.FAN
-        elif regs[BCM_REG_FIRE_STATE] == 0:
-            return HVACAction.IDLE
-        else:
-            return HVACAction.HEATING
+        # out mode does not affect action, fan is not reported as HVACAction.FAN
+        return self._HVAC_ACTION_TABLE[
+            ((regs[BCM_REG_FIRE_STATE] != 0) << 1) | (regs[BCM_REG_ONOFF] != 0)
+        ]
 
     def _parse_oper_mode(self, regs: List[int]) -> BcmOpMode:
         r"""보일러 운전모드 파싱
@@ -527,7 +504,7 @@ class Bcm300(SihasEntity, ClimateEntity):
         return BcmOpMode(
             (reg & 1) != 0,
             (reg & (1 << 1)) != 0,
-            BcmHeatMode.Ondol if (reg & (1 << 2)) != 0 else BcmHeatMode.Room,
+            _BCM_HEAT_MODES[(reg >> 2) & 1],
         )
 
 
@@ -571,7 +548,7 @@ class TcmFanPower(IntEnum):
     HIGH = 3
 
 
-class Tcm300(SihasEntity, ClimateEntity):
+class Tcm300(SihasCoordinatorEntity, ClimateEntity):
     _attr_icon = ICON_HEATER
     _attr_hvac_modes: Final = [HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL]
     _attr_max_temp: Final = 80
@@ -580,44 +557,35 @@ class Tcm300(SihasEntity, ClimateEntity):
     _attr_target_temperature_step: Final = 0.1
     _attr_temperature_unit: Final = UnitOfTemperature.CELSIUS
 
-    def __init__(
-        self,
-        ip: str,
-        mac: str,
-        device_type: str,
-        config: int,
-        name: str | None = None,
-    ) -> None:
-        super().__init__(
-            ip=ip,
-            mac=mac,
-            device_type=device_type,
-            config=config,
-            name=name,
-        )
+    def __init__(self, coordinator: SihasCoordinator, name: str | None = None) -> None:
+        super().__init__(coordinator, name=name)
 
-    def set_hvac_mode(self, hvac_mode: HVACMode):
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode):
         if hvac_mode == HVACMode.OFF:
-            self.command(TcmRegister.POWER, 0)
+            await self.coordinator.async_command(TcmRegister.POWER, 0)
         else:
-            self.command(TcmRegister.POWER, 1)
-            self.command(TcmRegister.RUN_MODE, TcmRunMode.from_hvac_mode(hvac_mode))
+            await self.coordinator.async_command(TcmRegister.POWER, 1)
+            await self.coordinator.async_command(
+                TcmRegister.RUN_MODE, TcmRunMode.from_hvac_mode(hvac_mode)
+            )
 
-    def set_temperature(self, **kwargs):
+    async def async_set_temperature(self, **kwargs):
         tmp = cast(float, kwargs.get(ATTR_TEMPERATURE))
-        self.command(TcmRegister.DESIRED_TEMPERATURE, int(tmp * 10))
-
-    def update(self):
-        if regs := self.poll():
-            is_off = regs[TcmRegister.POWER] == 0
-            cur_tmp = regs[TcmRegister.CURRENT_TEMPERATURE] / 10
-            set_tmp = regs[TcmRegister.DESIRED_TEMPERATURE] / 10
-            run_mode = TcmRunMode(regs[TcmRegister.RUN_MODE])
-
-            ## reserved
-            # out_mode = TcmOutMode(regs[TcmRegister.OUT_MODE])
-            # fan_power = TcmFanPower(regs[TcmRegister.FAN_POWER])
-
-            self._attr_hvac_mode = HVACMode.OFF if is_off else run_mode.to_hvac_mode()
-            self._attr_current_temperature = cur_tmp
-            self._attr_target_temperature = set_tmp
+        await self.coordinator.async_command(TcmRegister.DESIRED_TEMPERATURE, int(tmp * 10))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        regs = self.coordinator.data
+        is_off = regs[TcmRegister.POWER] == 0
+        cur_tmp = regs[TcmRegister.CURRENT_TEMPERATURE] / 10
+        set_tmp = regs[TcmRegister.DESIRED_TEMPERATURE] / 10
+        run_mode = TcmRunMode(regs[TcmRegister.RUN_MODE])
+
+        ## reserved
+        # out_mode = TcmOutMode(regs[TcmRegister.OUT_MODE])
+        # fan_power = TcmFanPower(regs[TcmRegister.FAN_POWER])
+
+        self._attr_hvac_mode = HVACMode.OFF if is_off else run_mode.to_hvac_mode()
+        self._attr_current_temperature = cur_tmp
+        self._attr_target_temperature = set_tmp
+        super()._handle_coordinator_update()
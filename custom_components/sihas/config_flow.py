@@ -1,10 +1,9 @@
 """Config flow for sihas integration."""
 from __future__ import annotations
 
-import asyncio
 import logging
-import time
-from typing import Any, Dict, List, cast
+from functools import lru_cache
+from typing import Any, Dict, Final, List, Tuple, cast
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
@@ -15,24 +14,58 @@ from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
     CONF_CFG,
-    CONF_HOST,
-    CONF_HOSTNAME,
     CONF_IP,
     CONF_MAC,
     CONF_NAME,
-    CONF_PROP,
     CONF_TYPE,
     DOMAIN,
-    MAC_OUI,
+    MAC_OUI_COLON,
     SUPPORT_DEVICE,
 )
 from .packet_builder import packet_builder as pb
-from .sender import scan, send
+from .sender import scan
 from .sihas_base import SihasBase
 from .util import MacConv, parse_scan_message
 
 _LOGGER = logging.getLogger(__name__)
 
+# schema of manual setup, which does not depend on flow
+DATA_SCHEMA: Final = vol.Schema(
+    {
+        vol.Required(CONF_IP): str,
+        vol.Required(CONF_MAC): str,
+        # sorted, to list choices in stable order
+        vol.Required(CONF_TYPE): vol.In(sorted(SUPPORT_DEVICE)),
+        vol.Required(CONF_CFG): int,
+        vol.Required(CONF_NAME): str,
+    }
+)
+
+
+@lru_cache(maxsize=256)
+def _parse_zeroconf(hostname: str, cfg: str) -> Tuple[str, str, int]:
+    """Parse mac, type and cfg from zeroconf announcement, which repeats for same device"""
+    # ['sihas', 'acm', '0a2998']
+    hostname_parts: List[str] = hostname.split(".")[0].split("_")
+
+    # OUI is fixed, colonize device specific part only
+    h = hostname_parts[2].lower()
+    return (
+        f"{MAC_OUI_COLON}{h[0:2]}:{h[2:4]}:{h[4:6]}",
+        hostname_parts[1].upper(),
+        int(cfg, 16),
+    )
+
+
+@lru_cache(maxsize=64)
+def _confirm_schema(default_name: str) -> vol.Schema:
+    """Schema of confirm step, only default name differs between devices"""
+    return vol.Schema(
+        {
+            vol.Required(CONF_NAME, default=default_name): cv.string,
+        }
+    )
+
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for sihas."""
@@ -56,13 +89,17 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         #     }
         # }
 
-        # ['sihas', 'acm', '0a2998']
-        hostname_parts: List[str] = discovery_info.hostname.split(".")[0].split("_")
-
-        self.data[CONF_IP] = discovery_info.host
-        self.data[CONF_MAC] = MacConv.insert_colon(MAC_OUI + hostname_parts[2]).lower()
-        self.data[CONF_TYPE] = hostname_parts[1].upper()
-        self.data[CONF_CFG] = int(discovery_info.properties[CONF_CFG], 16)
+        mac, device_type, cfg = _parse_zeroconf(
+            discovery_info.hostname, discovery_info.properties[CONF_CFG]
+        )
+        self.data.update(
+            {
+                CONF_IP: discovery_info.host,
+                CONF_MAC: mac,
+                CONF_TYPE: device_type,
+                CONF_CFG: cfg,
+            }
+        )
 
         if self.data[CONF_TYPE] not in SUPPORT_DEVICE:
             return self.async_abort(reason=f"not supported device type: {self.data[CONF_TYPE]}")
@@ -96,13 +133,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="zeroconf_confirm",
             # data_schema will used to obtain data from user
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_NAME, default=self.data[CONF_TYPE] + self.data[CONF_MAC]
-                    ): cv.string,
-                }
-            ),
+            data_schema=_confirm_schema(self.data[CONF_TYPE] + self.data[CONF_MAC]),
             # description_placeholders will used to format string
             description_placeholders={
                 CONF_MAC: self.data[CONF_MAC],
@@ -117,10 +148,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_dhcp(self, discovery_info: dhcp.DhcpServiceInfo):
         # data will come like
         #   {'ip': '192.168.xxx.xxx', 'hostname': 'esp[-_][0-9a-f]{12}', 'macaddress': '123456abcdef'}
-        _LOGGER.warn(f"sihas device found via dhcp: {discovery_info}")
-
-        # wait for device
-        await asyncio.sleep(10)
+        _LOGGER.warn("sihas device found via dhcp: %s", discovery_info)
 
         ip = cast(str, discovery_info.ip)
         mac = cast(str, discovery_info.macaddress)
@@ -129,20 +157,29 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._abort_if_unique_id_configured(updates={CONF_IP: ip})
 
         # SiHAS Scan
-        if resp := scan(pb.scan(), ip):
+        # device may be still booting, scan retries for a while(retry x timeout) and returns
+        # as soon as device responses, instead of waiting fixed time before scan.
+        # scan blocks until device responses or timeout, keep it out of event loop
+        if resp := await self.hass.async_add_executor_job(scan, pb.scan(), ip):
             scan_info = parse_scan_message(resp)
-            _LOGGER.debug(f"sihas device scanned: {scan_info}")
+            _LOGGER.debug("sihas device scanned: %s", scan_info)
 
-            if not scan_info[CONF_MAC] == MacConv.insert_colon(mac):
+            if not scan_info.mac == MacConv.insert_colon(mac):
                 _LOGGER.debug(
-                    f"device scanned but ip does not match: found={MacConv.insert_colon(mac)}, scanned={scan_info[CONF_MAC]}"
+                    "device scanned but ip does not match: found=%s, scanned=%s",
+                    MacConv.insert_colon(mac),
+                    scan_info.mac,
                 )
                 return self.async_abort(reason="device scanned but ip does not match")
 
-            self.data[CONF_IP] = scan_info[CONF_IP]
-            self.data[CONF_MAC] = scan_info[CONF_MAC].lower()
-            self.data[CONF_TYPE] = scan_info[CONF_TYPE]
-            self.data[CONF_CFG] = scan_info[CONF_CFG]
+            self.data.update(
+                {
+                    CONF_IP: scan_info.ip,
+                    CONF_MAC: scan_info.mac.lower(),
+                    CONF_TYPE: scan_info.type,
+                    CONF_CFG: scan_info.cfg,
+                }
+            )
 
             if self.data[CONF_TYPE] not in SUPPORT_DEVICE:
                 return self.async_abort(reason=f"not supported device type: {self.data[CONF_TYPE]}")
@@ -160,32 +197,26 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         else:
             # if not match, abort
-            _LOGGER.warn(f"found device but did not response about scan: {discovery_info}")
+            _LOGGER.warn("found device but did not response about scan: %s", discovery_info)
             return self.async_abort(reason="can not scan found device")
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         if user_input:
             # TODO: may need to confirm user input and check communicate with device.
-            self.data[CONF_IP] = user_input[CONF_IP]
-            self.data[CONF_MAC] = user_input[CONF_MAC]
-            self.data[CONF_TYPE] = user_input[CONF_TYPE]
-            self.data[CONF_CFG] = user_input[CONF_CFG]
-            self.data[CONF_NAME] = user_input[CONF_NAME]
+            self.data.update(
+                {
+                    CONF_IP: user_input[CONF_IP],
+                    CONF_MAC: user_input[CONF_MAC],
+                    CONF_TYPE: user_input[CONF_TYPE],
+                    CONF_CFG: user_input[CONF_CFG],
+                    CONF_NAME: user_input[CONF_NAME],
+                }
+            )
             return self.async_create_entry(
                 title=self.data[CONF_TYPE],
                 data=self.data,
             )
 
-        DATA_SCHEMA = vol.Schema(
-            {
-                vol.Required(CONF_IP): str,
-                vol.Required(CONF_MAC): str,
-                vol.Required(CONF_TYPE): vol.In(SUPPORT_DEVICE),
-                vol.Required(CONF_CFG): int,
-                vol.Required(CONF_NAME): str,
-            }
-        )
-
         return self.async_show_form(step_id="user", data_schema=DATA_SCHEMA)
 
 
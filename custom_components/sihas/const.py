@@ -1,5 +1,5 @@
 """Constants for the sihas integration."""
-from typing import Final, List, final
+from typing import Final, FrozenSet
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
@@ -40,27 +40,41 @@ DEVICE_TYPE: Final = {
     "SQM": 27,
 }
 
-SUPPORT_DEVICE: Final[List[str]] = [
-    "ACM",
-    "AQM",
-    "BCM",
-    "CCM",
-    "HCM",
-    "HVM",
-    "PMM",
-    "RBM",
-    "SBM",
-    "SDM",
-    "SQM",
-    "STM",
-    "TCM",
-]
+SUPPORT_DEVICE: Final[FrozenSet[str]] = frozenset(
+    {
+        "ACM",
+        "AQM",
+        "BCM",
+        "CCM",
+        "HCM",
+        "HVM",
+        "PMM",
+        "RBM",
+        "SBM",
+        "SDM",
+        "SQM",
+        "STM",
+        "TCM",
+    }
+)
+
+# devices, which share a poll through SihasCoordinator
+COORDINATED_DEVICE: Final[FrozenSet[str]] = frozenset(
+    {
+        "ACM",
+        "BCM",
+        "HCM",
+        "HVM",
+        "TCM",
+    }
+)
 
 DEFAULT_TIMEOUT: Final = 0.5
 PORT: Final = 502
 BUF_SIZE: Final = 1024
 
 MAC_OUI: Final = "a82bd6"
+MAC_OUI_COLON: Final = ":".join(MAC_OUI[i : i + 2] for i in (0, 2, 4)) + ":"
 
 REG_LENG: Final = 64
 
@@ -0,0 +1,98 @@
+"""Coordinator which share one poll between entities of a device."""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import List, Optional
+
+from homeassistant.const import ATTR_ATTRIBUTION
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+from typing_extensions import Final
+
+from .const import ATTRIBUTION, CONF_IP, CONF_MAC, CONF_TYPE
+from .sihas_base import SihasBase
+
+SCAN_INTERVAL: Final = timedelta(seconds=5)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SihasCoordinator(DataUpdateCoordinator[List[int]]):
+    """Poll registers of a device once per interval and push it to every entity of device.
+
+    Attributes
+    ----------
+    device : SihasBase
+        device to poll and command.
+    data : List[int]
+        registers of last successful poll.
+    """
+
+    def __init__(self, hass: HomeAssistant, device: SihasBase) -> None:
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{device.device_type}-{device.mac}",
+            update_interval=SCAN_INTERVAL,
+        )
+        self.device = device
+
+    async def _async_update_data(self) -> List[int]:
+        if registers := await self.device.async_poll():
+            return registers
+        raise UpdateFailed(f"failed to poll <{self.device.device_type}, {self.device.ip}>")
+
+    async def async_command(self, idx: int, val: int) -> bool:
+        """Excute Command and request additional Poll to apply result to entities"""
+        result = await self.device.async_command(idx, val)
+        await self.async_request_refresh()
+        return result
+
+    async def async_command_multiple(self, idx: int, vals: List[int]) -> bool:
+        """Write contiguous registers at once and request additional Poll"""
+        result = await self.device.async_command_multiple(idx, vals)
+        await self.async_request_refresh()
+        return result
+
+
+class SihasCoordinatorEntity(CoordinatorEntity[SihasCoordinator]):
+    """Provide common HA feature for entities backed by SihasCoordinator
+
+    Unique id follows same rule of `SihasEntity`.
+
+    Implementation should parse `coordinator.data` in `_handle_coordinator_update`, which
+    is also called when entity added, to apply registers polled before.
+    """
+
+    def __init__(
+        self,
+        coordinator: SihasCoordinator,
+        uid: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        super().__init__(coordinator)
+        device = coordinator.device
+
+        self._attr_unique_id = uid if uid else f"{device.device_type}-{device.mac}"
+        self._attr_name = name if name else self._attr_unique_id
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self.coordinator.data:
+            self._handle_coordinator_update()
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        device = self.coordinator.device
+        return {
+            ATTR_ATTRIBUTION: ATTRIBUTION,
+            CONF_MAC: device.mac,
+            CONF_IP: device.ip,
+            CONF_TYPE: device.device_type,
+        }
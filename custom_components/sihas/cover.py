@@ -58,6 +58,16 @@ REG_RBM_PCT_CMD: Final = 1  # 백분률 제어 레지스터   (0-100%)
 REG_RBM_STAT_CUR: Final = 2  # 현재 상태 레지스터     (0=닫힘, 1=열림, 2=정지, 3=닫힘중, 4=열림중)
 REG_RBM_PCT_CUR: Final = 3  # 현재 백분률 레지스터   (0-100%)
 
+# current state -> (is_closed, is_closing, is_opening)
+_RBM_STATE_MAP: Final = {
+    0: (True, False, False),
+    1: (False, False, False),
+    2: (False, False, False),
+    3: (False, True, False),
+    4: (False, False, True),
+}
+_RBM_STATE_UNKNOWN: Final = (False, False, False)
+
 
 class Rbm300(SihasEntity, CoverEntity):
     _attr_icon = ICON_CURTAIN
@@ -95,7 +105,10 @@ class Rbm300(SihasEntity, CoverEntity):
 
     def update(self):
         if regs := self.poll():
-            self._attr_is_closed = regs[REG_RBM_STAT_CUR] == 0
-            self._attr_is_closing = regs[REG_RBM_STAT_CUR] == 3
-            self._attr_is_opening = regs[REG_RBM_STAT_CUR] == 4
-            self._attr_current_cover_position = regs[REG_RBM_PCT_CUR]
+            stat, pct = regs[REG_RBM_STAT_CUR : REG_RBM_PCT_CUR + 1]
+            (
+                self._attr_is_closed,
+                self._attr_is_closing,
+                self._attr_is_opening,
+            ) = _RBM_STATE_MAP.get(stat, _RBM_STATE_UNKNOWN)
+            self._attr_current_cover_position = pct
@@ -12,7 +12,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .const import (
     CONF_CFG,
@@ -24,8 +23,8 @@ from .const import (
     ICON_LIGHT_BULB,
     SIHAS_PLATFORM_SCHEMA,
 )
-from .sihas_base import SihasProxy, SihasSubEntity
-from .util import normalize
+from .sihas_base import SihasProxy, SihasProxySubEntity
+from .util import ha_to_sihas_brightness, sihas_to_ha_brightness
 
 SCAN_INTERVAL = timedelta(seconds=5)
 
@@ -81,7 +80,7 @@ class StmSbm300(SihasProxy):
         return [StmSbmVirtualLight(self, i, self.name) for i in range(0, self.config)]
 
 
-class StmSbmVirtualLight(SihasSubEntity, LightEntity):
+class StmSbmVirtualLight(SihasProxySubEntity, LightEntity):
     _attr_icon = ICON_LIGHT_BULB
 
     def __init__(self, stbm: StmSbm300, number_of_switch: int, name: Optional[str] = None):
@@ -89,8 +88,6 @@ class StmSbmVirtualLight(SihasSubEntity, LightEntity):
 
         uid = f"{stbm.device_type}-{stbm.mac}-{number_of_switch}"
 
-        self._proxy = stbm
-        self._attr_available = self._proxy._attr_available
         self._state = None
         self._number_of_switch = number_of_switch
         self._attr_unique_id = uid
@@ -104,7 +101,6 @@ class StmSbmVirtualLight(SihasSubEntity, LightEntity):
     def update(self):
         self._proxy.update()
         self._state = self._proxy.registers[self._number_of_switch] == 1
-        self._attr_available = self._proxy._attr_available
 
     def turn_on(self, **kwargs):
         self._set_switch(True)
@@ -141,60 +137,34 @@ class Sdm300(SihasProxy):
         return [SdmVirtualLight(self, i, self.name) for i in range(0, num_of_switches)]
 
 
-class SdmVirtualLight(SihasSubEntity, LightEntity):
+class SdmVirtualLight(SihasProxySubEntity, LightEntity):
     _attr_icon = ICON_LIGHT_BULB
+    _attr_color_mode = ColorMode.BRIGHTNESS
+    _attr_supported_color_modes = {ColorMode.BRIGHTNESS}
 
     def __init__(self, stbm: Sdm300, number_of_switch: int, name: Optional[str] = None):
         super().__init__(stbm)
 
         uid = f"{stbm.device_type}-{stbm.mac}-{number_of_switch}"
 
-        self._proxy = stbm
-        self._attr_available = self._proxy._attr_available
         self._number_of_switch = number_of_switch
+        # on/off and brightness share same register
+        self._reg_idx = number_of_switch * 2
         self._attr_unique_id = uid
         self._attr_name = f"{name} #{number_of_switch + 1}" if name else uid
         self._attr_unique_id = uid
 
-    @property
-    def color_mode(self):
-        return ColorMode.BRIGHTNESS
-
-    @property
-    def supported_color_modes(self) -> set[str] | None:
-        return {ColorMode.BRIGHTNESS}
-
-    @property
-    def onoff_reg_idx(self) -> int:
-        return self._number_of_switch * 2
-
-    @property
-    def brightness_reg_idx(self) -> int:
-        return self._number_of_switch * 2
-
     def update(self):
         self._proxy.update()
 
-        self._attr_is_on = self._proxy.registers[self.onoff_reg_idx]
+        reg = self._proxy.registers[self._reg_idx]
+        self._attr_is_on = reg
 
-        bright = normalize(
-            (1, 100),
-            (0, 255),
-            self._proxy.registers[self.brightness_reg_idx]
-        )
-        self._attr_brightness = bright
-
-        self._attr_available = self._proxy._attr_available
+        self._attr_brightness = sihas_to_ha_brightness(reg)
 
     def turn_on(self, **kwargs):
         if ATTR_BRIGHTNESS in kwargs:
-            bright = normalize(
-                (0, 255),
-                (1, 100),
-                kwargs.get(ATTR_BRIGHTNESS)
-            )
-
-            self._set_brightness(bright)
+            self._set_brightness(ha_to_sihas_brightness(kwargs[ATTR_BRIGHTNESS]))
         else:
             self._set_brightness(101)
 
@@ -202,5 +172,5 @@ class SdmVirtualLight(SihasSubEntity, LightEntity):
             self._set_brightness(0)
 
     def _set_brightness(self, brightness: int):
-        self._proxy.command(self.brightness_reg_idx, brightness)
+        self._proxy.command(self._reg_idx, brightness)
 
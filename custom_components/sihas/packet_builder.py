@@ -1,7 +1,8 @@
 import logging
+import struct
 from typing import Final, List
 
-from .const import ENDIAN
+from .const import ENDIAN, REG_LENG
 from .errors import ModbusNotEnabledError, PacketSizeError
 
 _LOGGER = logging.getLogger(__name__)
@@ -9,12 +10,20 @@ _LOGGER = logging.getLogger(__name__)
 
 _FUNCTION_CODE_POLL: Final = (0x03).to_bytes(1, ENDIAN)
 _FUNCTION_CODE_COMMAND: Final = (0x06).to_bytes(1, ENDIAN)
+_FUNCTION_CODE_COMMAND_MULTIPLE: Final = (0x10).to_bytes(1, ENDIAN)
 
 POS_FUNCTION_CODE: Final = 7
 
 POLL_RESPONSE_LENGTH: Final = 137
 HEADER_LENGTH: Final = 7
 
+# poll request except header, which is same for every poll (read all registers)
+_POLL_BODY: Final = _FUNCTION_CODE_POLL + (0).to_bytes(2, ENDIAN) + REG_LENG.to_bytes(2, ENDIAN)
+
+# registers of poll response, start after header, function code and byte count
+POS_REGISTERS: Final = 9
+_REGISTERS_STRUCT: Final = struct.Struct(f">{REG_LENG}H")
+
 
 class packet_builder:
     _pid = 0
@@ -32,17 +41,12 @@ class packet_builder:
 
     @staticmethod
     def poll() -> bytes:
-        p = (
-            packet_builder._build_header(6)
-            + _FUNCTION_CODE_POLL
-            + (0).to_bytes(2, ENDIAN)
-            + (64).to_bytes(2, ENDIAN)
-        )
-        return p
+        # header can not be cached, it carries transaction id
+        return packet_builder._build_header(len(_POLL_BODY) + 1) + _POLL_BODY
 
     @staticmethod
     def command(reg_idx: int, reg_val: int) -> bytes:
-        _LOGGER.debug(f"setting register {reg_idx} as {reg_val}")
+        _LOGGER.debug("setting register %s as %s", reg_idx, reg_val)
 
         p = (
             packet_builder._build_header(6)
@@ -52,6 +56,22 @@ class packet_builder:
         )
         return p
 
+    @staticmethod
+    def command_multiple(reg_idx: int, reg_vals: List[int]) -> bytes:
+        """Write Multiple Registers, from `reg_idx` to `reg_idx + len(reg_vals) - 1`"""
+        _LOGGER.debug("setting registers from %s as %s", reg_idx, reg_vals)
+
+        values = b"".join(v.to_bytes(2, ENDIAN) for v in reg_vals)
+        p = (
+            packet_builder._build_header(7 + len(values))
+            + _FUNCTION_CODE_COMMAND_MULTIPLE
+            + reg_idx.to_bytes(2, ENDIAN)
+            + len(reg_vals).to_bytes(2, ENDIAN)
+            + len(values).to_bytes(1, ENDIAN)
+            + values
+        )
+        return p
+
     @staticmethod
     def _build_header(dlen: int) -> bytes:
         def _calc_checksum(b: bytes) -> bytes:
@@ -92,11 +112,7 @@ class packet_builder:
             return len(p) == POLL_RESPONSE_LENGTH
 
         def bytesToU16Arry(p: bytes) -> List[int]:
-            registers = list()
-            for i in range(64):
-                offset = 9 + i * 2
-                registers.append(int.from_bytes(p[offset : offset + 2], ENDIAN))
-            return registers
+            return list(_REGISTERS_STRUCT.unpack_from(p, POS_REGISTERS))
 
         if not isModbusEnabled(p):
             raise ModbusNotEnabledError()
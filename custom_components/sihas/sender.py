@@ -1,49 +1,235 @@
+import asyncio
 import logging
 import socket
+import threading
+import time
 import typing
 
 from .const import BUF_SIZE, DEFAULT_TIMEOUT, PORT
 from .errors import ModbusNotEnabledError
+from .packet_builder import POS_FUNCTION_CODE
 from .util import IpConv
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# (ip, port) -> (connected socket, lock to serialize request/response on it)
+_sockets: typing.Dict[typing.Tuple[str, int], typing.Tuple[socket.socket, threading.Lock]] = {}
+_sockets_lock = threading.Lock()
+
+
+def _get_socket(addr: typing.Tuple[str, int]) -> typing.Tuple[socket.socket, threading.Lock]:
+    with _sockets_lock:
+        if (entry := _sockets.get(addr)) is None:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.settimeout(DEFAULT_TIMEOUT)
+            sock.connect(addr)
+            entry = _sockets[addr] = (sock, threading.Lock())
+        return entry
+
+
+def _evict_socket(addr: typing.Tuple[str, int], sock: socket.socket) -> None:
+    with _sockets_lock:
+        if (entry := _sockets.get(addr)) is not None and entry[0] is sock:
+            del _sockets[addr]
+    sock.close()
+
+
+def close(ip: str, port: int = PORT) -> None:
+    """Close socket and endpoint kept for device, when it is no longer used(e.g. entry unloaded)
+
+    Must be called from event loop, as endpoints belong to it.
+    """
+    addr = (IpConv.remove_leading_zero(ip), port)
+    with _sockets_lock:
+        entry = _sockets.pop(addr, None)
+    if entry is not None:
+        entry[0].close()
+
+    if (protocol := _endpoints.pop(addr, None)) is not None and protocol.transport is not None:
+        protocol.transport.close()
+
+
+def _drain(sock: socket.socket) -> None:
+    """Discard late responses of previous requests, which timed out"""
+    sock.setblocking(False)
+    try:
+        while True:
+            sock.recv(BUF_SIZE)
+    except (BlockingIOError, ConnectionRefusedError):
+        pass
+    finally:
+        sock.settimeout(DEFAULT_TIMEOUT)
+
+
+def _is_response_of(req: bytes, resp: bytes) -> bool:
+    """Whether `resp` answers `req`, by function code(NAK bit masked)
+
+    Transaction id is not compared, as it is not documented that devices echo it.
+    """
+    return (
+        len(resp) > POS_FUNCTION_CODE and resp[POS_FUNCTION_CODE] & ~0x08 == req[POS_FUNCTION_CODE]
+    )
+
+
+def _recv_response(sock: socket.socket, req: bytes) -> bytes:
+    """Receive response of `req`, dropping late responses of other requests
+
+    Raise socket.timeout when no response of `req` arrived in DEFAULT_TIMEOUT.
+    """
+    deadline = time.monotonic() + DEFAULT_TIMEOUT
+    try:
+        while True:
+            resp = sock.recv(BUF_SIZE)
+            if _is_response_of(req, resp):
+                return resp
+
+            _LOGGER.debug("dropped packet which is not a response of request: %r", resp)
+            if (remain := deadline - time.monotonic()) <= 0:
+                raise socket.timeout()
+            sock.settimeout(remain)
+    finally:
+        sock.settimeout(DEFAULT_TIMEOUT)
+
+
 def send(data: bytes, ip: str, port: int = PORT, retry: int = 1) -> bytes:
     """Send packet to device
 
+    Socket is kept per device and reused, requests to same device are serialized.
+
     Raise ModbusNotEnabledError, socket.timeout and others
     """
 
     ip = IpConv.remove_leading_zero(ip)
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    while retry:
-        try:
-            sock.sendto(data, (ip, port))
-            sock.settimeout(DEFAULT_TIMEOUT)
-            resp = sock.recv(BUF_SIZE)
+    addr = (ip, port)
+    sock, lock = _get_socket(addr)
+    with lock:
+        _drain(sock)
+        while retry:
+            try:
+                sock.send(data)
+                resp = _recv_response(sock, data)
+
+            # connected socket reports ICMP unreachable, treat it as no response like before
+            except (socket.timeout, ConnectionRefusedError):
+                retry -= 1
+                continue
+
+            except OSError:
+                _evict_socket(addr, sock)
+                raise
+
             if (resp[7] & 0x08) != 0:
                 raise ModbusNotEnabledError(ip)
             return resp
 
-        except socket.timeout:
-            retry -= 1
+    raise socket.timeout()
 
-    raise socket.timeout
 
+class _DeviceProtocol(asyncio.DatagramProtocol):
+    """Datagram endpoint of a device, shared by every request to it
 
-def scan(data: bytes, ip: str, retry: int = 10) -> typing.Optional[str]:
-    while retry:
+    Only one request is in flight at once(`lock`), and packets which are not a response of
+    waiting `request`, such as late response of timed out request, are dropped.
+    """
+
+    def __init__(self, addr: typing.Tuple[str, int]) -> None:
+        self.addr = addr
+        self.lock = asyncio.Lock()
+        self.transport: typing.Optional[asyncio.DatagramTransport] = None
+        self.request: bytes = b""
+        self.response: typing.Optional[asyncio.Future[bytes]] = None
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        if self.response is None or self.response.done():
+            return
+        if not _is_response_of(self.request, data):
+            _LOGGER.debug("dropped packet which is not a response of request: %r", data)
+            return
+        self.response.set_result(data)
+
+    def connection_lost(self, exc) -> None:
+        if _endpoints.get(self.addr) is self:
+            del _endpoints[self.addr]
+
+
+# (ip, port) -> endpoint of device, used from event loop only
+_endpoints: typing.Dict[typing.Tuple[str, int], _DeviceProtocol] = {}
+
+
+async def _get_endpoint(addr: typing.Tuple[str, int]) -> _DeviceProtocol:
+    if (protocol := _endpoints.get(addr)) is not None:
+        return protocol
+
+    _, protocol = await asyncio.get_running_loop().create_datagram_endpoint(
+        lambda: _DeviceProtocol(addr), remote_addr=addr
+    )
+
+    # other request may created endpoint while awaiting
+    if (other := _endpoints.get(addr)) is not None:
+        protocol.transport.close()
+        return other
+
+    _endpoints[addr] = protocol
+    return protocol
+
+
+async def async_send(data: bytes, ip: str, port: int = PORT, retry: int = 1) -> bytes:
+    """Coroutine version of `send`, which does not block event loop
+
+    Endpoint is kept per device and reused, requests to same device are serialized.
+
+    Raise ModbusNotEnabledError, socket.timeout and others
+    """
+
+    ip = IpConv.remove_leading_zero(ip)
+    protocol = await _get_endpoint((ip, port))
+    async with protocol.lock:
+        protocol.request = data
+        protocol.response = asyncio.get_running_loop().create_future()
         try:
-            _LOGGER.debug(f"scanning device, {ip=} {data=}")
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.sendto(data, (ip, 502))
-            sock.settimeout(2)
-            return sock.recv(BUF_SIZE).decode()
-        except socket.timeout:
-            retry -= 1
-        except Exception as e:
-            _LOGGER.error(f"failed to scan device: , {e}")
-            break
-    _LOGGER.warn(f"failed to scan device: timeout")
+            while retry:
+                try:
+                    protocol.transport.sendto(data)
+                    resp = await asyncio.wait_for(
+                        asyncio.shield(protocol.response), DEFAULT_TIMEOUT
+                    )
+                    if (resp[7] & 0x08) != 0:
+                        raise ModbusNotEnabledError(ip)
+                    return resp
+
+                except asyncio.TimeoutError:
+                    retry -= 1
+        finally:
+            protocol.response = None
+
+    raise socket.timeout()
+
+
+def scan(data: bytes, ip: str, retry: int = 10) -> typing.Optional[str]:
+    # one socket for every retry; replies from other hosts are dropped, so a late
+    # answer of another device can not be taken as the scan result of `ip`
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        while retry:
+            try:
+                _LOGGER.debug("scanning device, ip=%r data=%r", ip, data)
+                sock.settimeout(2)
+                sock.sendto(data, (ip, PORT))
+                deadline = time.monotonic() + 2
+                while True:
+                    resp, (addr, _) = sock.recvfrom(BUF_SIZE)
+                    if addr == ip:
+                        return resp.decode()
+                    if (remain := deadline - time.monotonic()) <= 0:
+                        raise socket.timeout()
+                    sock.settimeout(remain)
+            except socket.timeout:
+                retry -= 1
+            except Exception as e:
+                _LOGGER.error("failed to scan device: , %s", e)
+                break
+    _LOGGER.warn("failed to scan device: timeout")
     return None
@@ -37,7 +37,7 @@ from .const import (
     ICON_POWER_METER,
     SIHAS_PLATFORM_SCHEMA,
 )
-from .sihas_base import SihasProxy, SihasSubEntity
+from .sihas_base import SihasProxy, SihasProxySubEntity
 from .util import register_put_u32
 
 SCAN_INTERVAL = timedelta(seconds=10)
@@ -247,13 +247,11 @@ class Pmm300(SihasProxy):
         ]
 
 
-class PmmVirtualSensor(SihasSubEntity, SensorEntity):
+class PmmVirtualSensor(SihasProxySubEntity, SensorEntity):
     _attr_icon = ICON_POWER_METER
 
     def __init__(self, proxy: Pmm300, conf: PmmConfig) -> None:
         super().__init__(proxy)
-        self._proxy = proxy
-        self._attr_available = self._proxy._attr_available
         self._attr_unique_id = f"{proxy.device_type}-{proxy.mac}-{conf.sub_id}"
         self._attr_native_unit_of_measurement = conf.nuom
         self._attr_name = f"{proxy.name} #{conf.sub_id}" if proxy.name else self._attr_unique_id
@@ -261,11 +259,16 @@ class PmmVirtualSensor(SihasSubEntity, SensorEntity):
         self._attr_state_class = conf.state_class
 
         self.value_handler: Callable = conf.value_handler
+        self._registers: Optional[List[int]] = None
 
     def update(self):
         self._proxy.update()
-        self._attr_native_value = self.value_handler(self._proxy.registers)
-        self._attr_available = self._proxy._attr_available
+        registers = self._proxy.registers
+        if registers is self._registers:
+            return
+
+        self._registers = registers
+        self._attr_native_value = self.value_handler(registers)
 
 
 class Aqm300(SihasProxy):
@@ -310,12 +313,10 @@ class Aqm300(SihasProxy):
         ]
 
 
-class AqmVirtualSensor(SihasSubEntity, SensorEntity):
+class AqmVirtualSensor(SihasProxySubEntity, SensorEntity):
     def __init__(self, proxy: Aqm300, conf: Dict) -> None:
         super().__init__(proxy)
 
-        self._proxy = proxy
-        self._attr_available = self._proxy._attr_available
         self._attr_unique_id = f"{proxy.device_type}-{proxy.mac}-{conf['device_class']}"
         self._attr_native_unit_of_measurement = conf["uom"]
         self._attr_name = f"{proxy.name} #{conf['sub_id']}" if proxy.name else self._attr_unique_id
@@ -327,4 +328,3 @@ class AqmVirtualSensor(SihasSubEntity, SensorEntity):
     def update(self):
         self._proxy.update()
         self._attr_native_value = self.value_handler(self._proxy.registers)
-        self._attr_available = self._proxy._attr_available
@@ -10,7 +10,7 @@ from typing_extensions import NotRequired
 from .const import ATTRIBUTION, CONF_IP, CONF_MAC, CONF_TYPE, DOMAIN, REG_LENG
 from .errors import ModbusNotEnabledError
 from .packet_builder import packet_builder as pb
-from .sender import send
+from .sender import async_send, send
 from .util import Debouncer
 
 _LOGGER = logging.getLogger(__name__)
@@ -20,6 +20,11 @@ class CommandOption(TypedDict):
     retry: NotRequired[int]
 
 
+_DEFAULT_COMMAND_OPTION: CommandOption = {
+    "retry": 3,
+}
+
+
 class SihasBase:
     """Representation of an base class of Sihas device
 
@@ -67,18 +72,38 @@ class SihasBase:
         try:
             req = pb.poll()
             resp = send(req, self.ip, retry=3)
-            regs = pb.extract_registers(resp)
-            self._attr_available = True
-            assert len(regs) == REG_LENG
-            return regs
+            return self._extract_polled_registers(resp)
+
+        except Exception as err:
+            self._handle_poll_error(err)
+        return None
+
+    async def async_poll(self) -> Optional[List[int]]:
+        """Coroutine version of `poll`, which does not block event loop."""
 
-        except ModbusNotEnabledError:
+        try:
+            req = pb.poll()
+            resp = await async_send(req, self.ip, retry=3)
+            return self._extract_polled_registers(resp)
+
+        except Exception as err:
+            self._handle_poll_error(err)
+        return None
+
+    def _extract_polled_registers(self, resp: bytes) -> List[int]:
+        regs = pb.extract_registers(resp)
+        self._attr_available = True
+        assert len(regs) == REG_LENG
+        return regs
+
+    def _handle_poll_error(self, err: Exception) -> None:
+        if isinstance(err, ModbusNotEnabledError):
             _LOGGER.warn("failed to update: modbus not enabled <%s, %s>", self.device_type, self.ip)
 
-        except socket.timeout:
+        elif isinstance(err, socket.timeout):
             _LOGGER.debug("failed to update: timeout <%s, %s>", self.device_type, self.ip)
 
-        except Exception as err:
+        else:
             _LOGGER.error(
                 "failed to update: unhandled exception: %s <%s, %s>",
                 err,
@@ -89,15 +114,10 @@ class SihasBase:
         # if exception catched
         if self._attr_available:
             self._attr_available = False
-            _LOGGER.info(f"device set to not available <{self.device_type, self.ip}>")
-        return None
+            _LOGGER.info("device set to not available <%s, %s>", self.device_type, self.ip)
 
     def command(self, idx: int, val: int, opt: CommandOption = {}) -> bool:
-        default_opt: CommandOption = {
-            "retry": 3,
-        }
-
-        opt = default_opt | opt
+        opt = _DEFAULT_COMMAND_OPTION | opt
 
         try:
             req = pb.command(idx, val)
@@ -105,23 +125,62 @@ class SihasBase:
                 self._attr_available = True
                 return True
 
-        except ModbusNotEnabledError:
+        except Exception as err:
+            self._handle_command_error(err)
+
+        self._attr_available = False
+        return False
+
+    async def async_command(self, idx: int, val: int, opt: CommandOption = {}) -> bool:
+        """Coroutine version of `command`, which does not block event loop."""
+        opt = _DEFAULT_COMMAND_OPTION | opt
+
+        try:
+            req = pb.command(idx, val)
+            if await async_send(req, self.ip, retry=opt["retry"]):
+                self._attr_available = True
+                return True
+
+        except Exception as err:
+            self._handle_command_error(err)
+
+        self._attr_available = False
+        return False
+
+    async def async_command_multiple(
+        self, idx: int, vals: List[int], opt: CommandOption = {}
+    ) -> bool:
+        """Write contiguous registers from `idx` at once, with single request"""
+        opt = _DEFAULT_COMMAND_OPTION | opt
+
+        try:
+            req = pb.command_multiple(idx, vals)
+            if await async_send(req, self.ip, retry=opt["retry"]):
+                self._attr_available = True
+                return True
+
+        except Exception as err:
+            self._handle_command_error(err)
+
+        self._attr_available = False
+        return False
+
+    def _handle_command_error(self, err: Exception) -> None:
+        if isinstance(err, ModbusNotEnabledError):
             _LOGGER.warn(
                 "failed to command: modbus not enabled <%s, %s>", self.device_type, self.ip
             )
 
-        except socket.timeout:
+        elif isinstance(err, socket.timeout):
             _LOGGER.info("failed to command: timeout <%s, %s>", self.device_type, self.ip)
 
-        except Exception as err:
+        else:
             _LOGGER.warn(
                 "failed to command: unhandled exception: %s <%s, %s>",
                 err,
                 self.device_type,
                 self.ip,
             )
-        self._attr_available = False
-        return False
 
 
 class SihasEntity(SihasBase, Entity):
@@ -180,7 +239,7 @@ class SihasProxy(SihasBase):
     ----
     Virtual Entity, which *has* SihasProxy instance, must follow below requirements:
         - Set `_attr_unique_id` when initializing.
-        - Sync `_attr_available` after update.
+        - Inherit `SihasProxySubEntity`, to follow availability of proxy.
 
     Attributes
     ----------
@@ -188,7 +247,8 @@ class SihasProxy(SihasBase):
         hold registers to update whole state.
     _proxy_updater: Debouncer
         Debouncer to prevent poll many times at once about one device, because of
-        sub-device instances.
+        sub-device instances. All sub-entities of one scan share a single poll, which
+        reads whole register map in one request.
     """
 
     def __init__(
@@ -208,7 +268,8 @@ class SihasProxy(SihasBase):
         self._proxy_updater = Debouncer(self._internal_update)
 
     def _internal_update(self):
-        if registers := self.poll():
+        # keep identity of unchanged registers, so sub-entities can skip re-parsing them
+        if (registers := self.poll()) and registers != self.registers:
             self.registers = registers
 
     def update(self, force=False):
@@ -222,9 +283,13 @@ class SihasProxy(SihasBase):
         self._proxy_updater.run(force)
 
     def command(self, idx, val) -> None:
-        """Excute Command and additional Poll to avoid debouncer"""
+        """Excute Command and additional Poll
+
+        Poll is forced through debouncer, so sub-entities updating right after command
+        reuse its result instead of polling again.
+        """
         super().command(idx, val)
-        self._internal_update()
+        self._proxy_updater.run(force=True)
 
     def get_sub_entities(self) -> List[Entity]:
         """Generate sub-instances"""
@@ -243,8 +308,9 @@ class SihasSubEntity(metaclass=ABCMeta):
     """
     This class provides some functionality for sub devices.
 
-    Sub devices, which created by SihasProxy's implementation, can inherit this class.
-        e.g) `PmmVirtualSensor`
+    Sub devices, which created by SihasProxy's implementation or share a coordinated
+    device, can inherit this class.
+        e.g) `PmmVirtualSensor`, `HcmHvmVirtualThermostat`
 
     By inherit this class, sub entities can be grouped as Device.
         See also: [Device Registry](https://developers.home-assistant.io/docs/device_registry_index/)
@@ -256,7 +322,7 @@ class SihasSubEntity(metaclass=ABCMeta):
 
     info: DeviceInfo
 
-    def __init__(self, proxy: SihasProxy) -> None:
+    def __init__(self, proxy: SihasBase) -> None:
         self.info = {
             "identifiers": {(DOMAIN, proxy.mac)},
             "model": proxy.device_type,
@@ -268,3 +334,19 @@ class SihasSubEntity(metaclass=ABCMeta):
     def device_info(self) -> DeviceInfo:
         """Information about this entity/device."""
         return self.info
+
+
+class SihasProxySubEntity(SihasSubEntity):
+    """
+    Sub entity, which polls through SihasProxy.
+
+    Availability is read from proxy, so sub entities does not need to copy it after update.
+    """
+
+    def __init__(self, proxy: SihasProxy) -> None:
+        super().__init__(proxy)
+        self._proxy = proxy
+
+    @property
+    def available(self) -> bool:
+        return self._proxy._attr_available
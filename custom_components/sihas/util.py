@@ -1,6 +1,7 @@
-from datetime import datetime
-from logging import StringTemplateStyle
-from typing import Callable, Dict
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, NamedTuple
 
 from .const import DEFAULT_DEBOUNCE_DURATION
 
@@ -8,37 +9,46 @@ from .const import DEFAULT_DEBOUNCE_DURATION
 class Debouncer:
     """Simple Debouncer.
 
+    Callers arriving while callback is running wait for it to finish, so every caller
+    sees the result of the same run instead of the previous one.
+
     Attributes
     ----------
         _duration        interval duration in seconds
         _callback        function which called by debouncer
-        _last_excuted    last excuted time
+        _last_excuted    last excuted time, from monotonic clock
+        _lock            serialize callers, which may come from executor threads
     """
 
     def __init__(self, callback: Callable, duration: int = DEFAULT_DEBOUNCE_DURATION) -> None:
-        self._last_excuted = datetime.now()
+        self._last_excuted = time.monotonic()
         self._duration = duration
         self._callback = callback
+        self._lock = threading.Lock()
 
     def run(self, force=False) -> bool:
         """
         Try to run callback and return True if success.
         """
-        t = datetime.now()
-        if force or ((t - self._last_excuted).total_seconds() > self._duration):
-            self._last_excuted = t
-            self._callback()
-            return True
-        return False
+        with self._lock:
+            t = time.monotonic()
+            if force or (t - self._last_excuted > self._duration):
+                self._last_excuted = t
+                self._callback()
+                return True
+            return False
 
 
 class IpConv:
     @staticmethod
+    @lru_cache(maxsize=256)
     def remove_leading_zero(s: str) -> str:
-        # ".".join([str(int(i)) for i in ip.split(".")])
-        import re
-
-        return re.sub(r"\b0+(\d)", r"\1", s)
+        """192.168.001.010 -> 192.168.1.10, cached since ip of device rarely changes"""
+        try:
+            return ".".join([str(int(i)) for i in s.split(".")])
+        except ValueError:
+            # not a dotted decimal, such as hostname
+            return s
 
 
 class MacConv:
@@ -47,28 +57,29 @@ class MacConv:
         if ":" in s:
             return s
 
-        # ['AB', 'CD', 'EF', '12', '34', '56']
-        mac_parts = [s[2 * i : 2 + 2 * i] for i in range(6)]
-        return ":".join(mac_parts)
+        # ABCDEF123456 -> AB:CD:EF:12:34:56
+        return f"{s[0:2]}:{s[2:4]}:{s[4:6]}:{s[6:8]}:{s[8:10]}:{s[10:12]}"
 
     @staticmethod
     def remove_colon(s: str):
         return s.replace(":", "")
 
 
-def parse_scan_message(msg: str) -> Dict:
-    type = msg[6:9]
-    version = msg[11:16]
-    mac = msg[21:38]
-    ip = msg[42:57]
-    config = int(msg[62:64], 16)
+class ScanInfo(NamedTuple):
+    type: str
+    mac: str
+    ip: str
+    cfg: int
 
-    return {
-        "type": type,
-        "mac": mac,
-        "ip": IpConv.remove_leading_zero(ip),
-        "cfg": config,
-    }
+
+def parse_scan_message(msg: str) -> ScanInfo:
+    # fixed width text, version(msg[11:16]) is not used
+    return ScanInfo(
+        type=msg[6:9],
+        mac=msg[21:38],
+        ip=IpConv.remove_leading_zero(msg[42:57]),
+        cfg=int(msg[62:64], 16),
+    )
 
 
 def register_put_u32(b1: int, b2: int) -> int:
@@ -92,3 +103,19 @@ def normalize(r1: tuple[int, int], r2: tuple[int, int], v: int) -> int:
     # Round the result to the nearest integer
     return round(normalized_value)
 
+
+# brightness of sihas(1 to 100) <-> HA(0 to 255), tabulated from normalize as same result
+_SIHAS_TO_HA_BRIGHTNESS = tuple(normalize((1, 100), (0, 255), v) for v in range(0, 101))
+_HA_TO_SIHAS_BRIGHTNESS = tuple(normalize((0, 255), (1, 100), v) for v in range(0, 256))
+
+
+def sihas_to_ha_brightness(v: int) -> int:
+    if 0 <= v < len(_SIHAS_TO_HA_BRIGHTNESS):
+        return _SIHAS_TO_HA_BRIGHTNESS[v]
+    return normalize((1, 100), (0, 255), v)
+
+
+def ha_to_sihas_brightness(v: int) -> int:
+    if 0 <= v < len(_HA_TO_SIHAS_BRIGHTNESS):
+        return _HA_TO_SIHAS_BRIGHTNESS[v]
+    return normalize((0, 255), (1, 100), v)